@@ -67,7 +67,7 @@ def _parse_cmudict(file: IO[str]) -> dict[str, list[str]]:
     for line in file:
         line = line.split("#")[0].strip()  # remove comments
         parts = line.split(" ", maxsplit=1)
-        word = re.sub(_alt_re, "", parts[0])
+        word = _alt_re.sub("", parts[0])
         pronunciation = parts[1].strip()
         cmudict[word].append(pronunciation)
     return dict(cmudict)
@@ -22,20 +22,7 @@ from ko_speech_tools.g2p.cmudict import CMUDict
 from ko_speech_tools.g2p.english import convert_eng
 from ko_speech_tools.g2p.numerals import convert_num
 from ko_speech_tools.g2p.regular import link1, link2, link3, link4
-from ko_speech_tools.g2p.special import (
-    balb,
-    consonant_ui,
-    jamo,
-    josa_ui,
-    jyeo,
-    modifying_rieul,
-    palatalize,
-    rieulbieub,
-    rieulgiyeok,
-    verb_nieun,
-    vowel_ui,
-    ye,
-)
+from ko_speech_tools.g2p.special import apply_all
 from ko_speech_tools.g2p.utils import (
     annotate,
     compose,
@@ -69,7 +56,9 @@ class G2p:
     def __init__(self) -> None:
         """Create a G2p instance."""
         self.mecab = self.get_mecab()
-        self.table = parse_table()
+        self.table = [
+            (re.compile(str1), str2, rule_ids) for str1, str2, rule_ids in parse_table()
+        ]
 
         self.cmu = CMUDict()  # for English
         self.rule2text = get_rule_id2text()  # for comments of main rules
@@ -119,7 +108,8 @@ class G2p:
         out = string
         for str1, str2 in self._idioms:
             out = out.replace(str1, str2)
-        gloss(verbose, out, string, "from idioms.txt")
+        if verbose:
+            gloss(out, string, "from idioms.txt")
         return out
 
     def __call__(
@@ -175,35 +165,19 @@ class G2p:
         inp = h2j(string)
 
         # 6. special
-        for func in (
-            jyeo,
-            ye,
-            consonant_ui,
-            josa_ui,
-            vowel_ui,
-            jamo,
-            rieulgiyeok,
-            rieulbieub,
-            verb_nieun,
-            balb,
-            palatalize,
-            modifying_rieul,
-        ):
-            inp = func(inp, descriptive=descriptive, verbose=verbose)
+        inp = apply_all(inp, descriptive=descriptive, verbose=verbose)
         inp = _ANNOTATION_TAG_RE.sub("", inp)
 
         # 7. regular table: batchim + onset
-        for str1, str2, rule_ids in self.table:
+        for pattern, str2, rule_ids in self.table:
             _inp = inp
-            inp = re.sub(str1, str2, inp)
+            inp = pattern.sub(str2, inp)
 
-            if len(rule_ids) > 0:
+            if verbose:
                 rule = "\n".join(
                     self.rule2text.get(rule_id, "") for rule_id in rule_ids
                 )
-            else:
-                rule = ""
-            gloss(verbose, inp, _inp, rule)
+                gloss(inp, _inp, rule)
 
         # 8 link
         for func in (link1, link2, link3, link4):
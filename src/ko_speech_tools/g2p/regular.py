@@ -41,7 +41,8 @@ def link1(inp: str, *, verbose: bool = False) -> str:
     for str1, str2 in pairs:
         out = out.replace(str1, str2)
 
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, rule)
     return out
 
 
@@ -72,7 +73,8 @@ def link2(inp: str, *, verbose: bool = False) -> str:
     for str1, str2 in pairs:
         out = out.replace(str1, str2)
 
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, rule)
     return out
 
 
@@ -118,7 +120,8 @@ def link3(inp: str, *, verbose: bool = False) -> str:
     for str1, str2 in pairs:
         out = out.replace(str1, str2)
 
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, rule)
     return out
 
 
@@ -141,5 +144,6 @@ def link4(inp: str, *, verbose: bool = False) -> str:
     for str1, str2 in pairs:
         out = out.replace(str1, str2)
 
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, rule)
     return out
@@ -8,7 +8,8 @@ Special rule for processing Hangul.
 
 Adapted from: https://github.com/harmlessman/g2pkk
 
-Main change: precompiling regular expressions.
+Main changes: precompiling regular expressions and applying independent rules
+in a single pass (see `apply_all`).
 """
 
 import re
@@ -17,44 +18,120 @@ from ko_speech_tools.g2p.utils import get_rule_id2text, gloss
 
 rule_id2text = get_rule_id2text()
 
+# Rule descriptions shown with verbose=True
+_RULE_JYEO = rule_id2text["5.1"]
+_RULE_YE = rule_id2text["5.2"]
+_RULE_CONSONANT_UI = rule_id2text["5.3"]
+_RULE_JOSA_UI = rule_id2text["5.4.2"]
+_RULE_VOWEL_UI = rule_id2text["5.4.1"]
+_RULE_JAMO = rule_id2text["16"]
+_RULE_RIEULGIYEOK = rule_id2text["11.1"]
+_RULE_RIEULBIEUB = rule_id2text["25"]
+_RULE_VERB_NIEUN = rule_id2text["24"]
+_RULE_BALB = rule_id2text["10.1"]
+_RULE_PALATALIZE = rule_id2text["17"]
+_RULE_MODIFYING_RIEUL = rule_id2text["27"]
+
 # Precompiled regex patterns
-_JYEO_RE = re.compile("([ᄌᄍᄎ])ᅧ")
-_YE_RE = re.compile("([ᄀᄁᄃᄄㄹᄆᄇᄈᄌᄍᄎᄏᄐᄑᄒ])ᅨ")
-_CONSONANT_UI_RE = re.compile("([ᄀᄁᄂᄃᄄᄅᄆᄇᄈᄉᄊᄌᄍᄎᄏᄐᄑᄒ])ᅴ")
-_JOSA_UI_RE = re.compile("의/J")
+# The vowel comes first and the preceding consonant is checked by a lookbehind,
+# so that the regex engine can search for the literal vowel.
+_JYEO_RE = re.compile("ᅧ(?<=[ᄌᄍᄎ]ᅧ)")
+_YE_RE = re.compile("ᅨ(?<=[ᄀᄁᄃᄄㄹᄆᄇᄈᄌᄍᄎᄏᄐᄑᄒ]ᅨ)")
+_CONSONANT_UI_RE = re.compile("ᅴ(?<=[ᄀᄁᄂᄃᄄᄅᄆᄇᄈᄉᄊᄌᄍᄎᄏᄐᄑᄒ]ᅴ)")
 _VOWEL_UI_RE = re.compile(r"(\Sᄋ)ᅴ")
-_JAMO_1_RE = re.compile("([그])ᆮᄋ")
-_JAMO_2_RE = re.compile("([으])[ᆽᆾᇀᇂ]ᄋ")
-_JAMO_3_RE = re.compile("([으])[ᆿ]ᄋ")
-_JAMO_4_RE = re.compile("([으])[ᇁ]ᄋ")
-_RIEULGIYEOK_RE = re.compile("ᆰ/P([ᄀᄁ])")
-_RIEULBIEUB_1_RE = re.compile("([ᆲᆴ])/Pᄀ")
-_RIEULBIEUB_2_RE = re.compile("([ᆲᆴ])/Pᄃ")
-_RIEULBIEUB_3_RE = re.compile("([ᆲᆴ])/Pᄉ")
-_RIEULBIEUB_4_RE = re.compile("([ᆲᆴ])/Pᄌ")
-_VERB_NIEUN_1_RE = re.compile("([ᆫᆷ])/Pᄀ")
-_VERB_NIEUN_2_RE = re.compile("([ᆫᆷ])/Pᄃ")
-_VERB_NIEUN_3_RE = re.compile("([ᆫᆷ])/Pᄉ")
-_VERB_NIEUN_4_RE = re.compile("([ᆫᆷ])/Pᄌ")
-_VERB_NIEUN_5_RE = re.compile("ᆬ/Pᄀ")
-_VERB_NIEUN_6_RE = re.compile("ᆬ/Pᄃ")
-_VERB_NIEUN_7_RE = re.compile("ᆬ/Pᄉ")
-_VERB_NIEUN_8_RE = re.compile("ᆬ/Pᄌ")
-_VERB_NIEUN_9_RE = re.compile("ᆱ/Pᄀ")
-_VERB_NIEUN_10_RE = re.compile("ᆱ/Pᄃ")
-_VERB_NIEUN_11_RE = re.compile("ᆱ/Pᄉ")
-_VERB_NIEUN_12_RE = re.compile("ᆱ/Pᄌ")
+_JAMO_RE = re.compile("(?:[그]ᆮ|[으][ᆽᆾᇀᇂᆿᇁ])ᄋ")
+_RIEULGIYEOK_RE = re.compile("ᆰ/P[ᄀᄁ]")
+_RIEULBIEUB_RE = re.compile("[ᆲᆴ]/P[ᄀᄃᄉᄌ]")
+_VERB_NIEUN_RE = re.compile("[ᆫᆬᆷᆱ]/P[ᄀᄃᄉᄌ]")
 _BALB_1_RE = re.compile("(바)ᆲ($|[^ᄋᄒ])")
 _BALB_2_RE = re.compile("(너)ᆲ([ᄌᄍ]ᅮ|[ᄃᄄ]ᅮ)")
-_PALATALIZE_1_RE = re.compile("ᆮᄋ([ᅵᅧ])")
-_PALATALIZE_2_RE = re.compile("ᇀᄋ([ᅵᅧ])")
-_PALATALIZE_3_RE = re.compile("ᆴᄋ([ᅵᅧ])")
-_PALATALIZE_4_RE = re.compile("ᆮᄒ([ᅵ])")
-_MODIFYING_RIEUL_1_RE = re.compile("ᆯ/E ᄀ")
-_MODIFYING_RIEUL_2_RE = re.compile("ᆯ/E ᄃ")
-_MODIFYING_RIEUL_3_RE = re.compile("ᆯ/E ᄇ")
-_MODIFYING_RIEUL_4_RE = re.compile("ᆯ/E ᄉ")
-_MODIFYING_RIEUL_5_RE = re.compile("ᆯ/E ᄌ")
+_PALATALIZE_RE = re.compile("ᆮᄋ[ᅵᅧ]|ᇀᄋ[ᅵᅧ]|ᆴᄋ[ᅵᅧ]|ᆮᄒ[ᅵ]")
+_MODIFYING_RIEUL_RE = re.compile(
+    "ᆯ(?:/E [ᄀᄃᄇᄉᄌ]|걸|밖에|세라|수록|지라도|지언정|진대)"
+)
+
+# Combined patterns for apply_all(). Every alternative starts with a literal
+# character, which lets the regex engine skip ahead to possible matches quickly.
+# The first character also identifies the rule.
+_STEM_CODA_RE = re.compile(
+    "[그]ᆮᄋ|[으][ᆽᆾᇀᇂᆿᇁ]ᄋ"  # jamo
+    "|ᆰ/P[ᄀᄁ]"  # rieulgiyeok
+    "|ᆲ/P[ᄀᄃᄉᄌ]|ᆴ/P[ᄀᄃᄉᄌ]"  # rieulbieub
+    "|ᆫ/P[ᄀᄃᄉᄌ]|ᆬ/P[ᄀᄃᄉᄌ]|ᆷ/P[ᄀᄃᄉᄌ]|ᆱ/P[ᄀᄃᄉᄌ]"  # verb_nieun
+)
+_PALATALIZE_MODIFYING_RIEUL_RE = re.compile(
+    f"{_PALATALIZE_RE.pattern}|{_MODIFYING_RIEUL_RE.pattern}"
+)
+
+# At least one of these must occur in the input for the respective rules to
+# match. Checking for them is cheaper than running the regexes.
+_JAMO_TRIGGERS = ("그", "으")
+_RIEULBIEUB_TRIGGERS = ("ᆲ/P", "ᆴ/P")
+_PALATALIZE_TRIGGERS = ("ᆮ", "ᇀ", "ᆴ")
+_STEM_CODA_TRIGGERS = ("/P", *_JAMO_TRIGGERS)
+_PALATALIZE_MODIFYING_RIEUL_TRIGGERS = ("ᆯ", *_PALATALIZE_TRIGGERS)
+
+# Lookup tables for the replacements
+_TENSE = {"ᄀ": "ᄁ", "ᄃ": "ᄄ", "ᄇ": "ᄈ", "ᄉ": "ᄊ", "ᄌ": "ᄍ"}
+# fmt: off
+_JAMO_CODA_TO_ONSET = {
+    "ᆮ": "ᄉ", "ᆽ": "ᄉ", "ᆾ": "ᄉ", "ᇀ": "ᄉ", "ᇂ": "ᄉ", "ᆿ": "ᄀ", "ᇁ": "ᄇ",
+}
+# fmt: on
+_VERB_NIEUN_CODA = {"ᆫ": "ᆫ", "ᆬ": "ᆫ", "ᆷ": "ᆷ", "ᆱ": "ᆷ"}
+_PALATALIZED = {"ᆮᄋ": "ᄌ", "ᇀᄋ": "ᄎ", "ᆴᄋ": "ᆯᄎ", "ᆮᄒ": "ᄎ"}
+_MODIFYING_RIEUL_LITERALS = {
+    "ᆯ걸": "ᆯ껄",
+    "ᆯ밖에": "ᆯ빠께",
+    "ᆯ세라": "ᆯ쎄라",
+    "ᆯ수록": "ᆯ쑤록",
+    "ᆯ지라도": "ᆯ찌라도",
+    "ᆯ지언정": "ᆯ찌언정",
+    "ᆯ진대": "ᆯ찐대",
+}
+
+
+def _contains_any(inp: str, substrings: tuple[str, ...]) -> bool:
+    return any(substring in inp for substring in substrings)
+
+
+def _jamo_repl(m: re.Match[str]) -> str:
+    return m[0][0] + _JAMO_CODA_TO_ONSET[m[0][1]]
+
+
+def _rieulbieub_repl(m: re.Match[str]) -> str:
+    return m[0][0] + _TENSE[m[0][3]]
+
+
+def _verb_nieun_repl(m: re.Match[str]) -> str:
+    return _VERB_NIEUN_CODA[m[0][0]] + _TENSE[m[0][3]]
+
+
+def _palatalize_repl(m: re.Match[str]) -> str:
+    return _PALATALIZED[m[0][:2]] + m[0][2]
+
+
+def _modifying_rieul_repl(m: re.Match[str]) -> str:
+    if m[0][1] == "/":
+        return "ᆯ " + _TENSE[m[0][4]]
+    return _MODIFYING_RIEUL_LITERALS[m[0]]
+
+
+def _stem_coda_repl(m: re.Match[str]) -> str:
+    first = m[0][0]
+    if first in "그으":
+        return _jamo_repl(m)
+    if first == "ᆰ":
+        return "ᆯᄁ"
+    if first in "ᆲᆴ":
+        return _rieulbieub_repl(m)
+    return _verb_nieun_repl(m)
+
+
+def _palatalize_modifying_rieul_repl(m: re.Match[str]) -> str:
+    if m[0][0] == "ᆯ":
+        return _modifying_rieul_repl(m)
+    return _palatalize_repl(m)
 
 
 ############################ vowels ############################
@@ -69,11 +146,11 @@ def jyeo(inp: str, *, descriptive: bool = False, verbose: bool = False) -> str:
     Returns:
         String with jyeo rule applied.
     """
-    rule = rule_id2text["5.1"]
     # 일반적인 규칙으로 취급한다 by kyubyong
 
-    out = _JYEO_RE.sub(r"\1ᅥ", inp)
-    gloss(verbose, out, inp, rule)
+    out = _JYEO_RE.sub("ᅥ", inp)
+    if verbose:
+        gloss(out, inp, _RULE_JYEO)
     return out
 
 
@@ -88,11 +165,11 @@ def ye(inp: str, *, descriptive: bool = False, verbose: bool = False) -> str:
     Returns:
         String with ye rule applied.
     """
-    rule = rule_id2text["5.2"]
     # 실제로 언중은 예, 녜, 셰, 쎼 이외의 'ㅖ'는 [ㅔ]로 발음한다. by kyubyong
 
-    out = _YE_RE.sub(r"\1ᅦ", inp) if descriptive else inp
-    gloss(verbose, out, inp, rule)
+    out = _YE_RE.sub("ᅦ", inp) if descriptive else inp
+    if verbose:
+        gloss(out, inp, _RULE_YE)
     return out
 
 
@@ -107,10 +184,9 @@ def consonant_ui(inp: str, *, descriptive: bool = False, verbose: bool = False)
     Returns:
         String with consonant_ui rule applied.
     """
-    rule = rule_id2text["5.3"]
-
-    out = _CONSONANT_UI_RE.sub(r"\1ᅵ", inp)
-    gloss(verbose, out, inp, rule)
+    out = _CONSONANT_UI_RE.sub("ᅵ", inp)
+    if verbose:
+        gloss(out, inp, _RULE_CONSONANT_UI)
     return out
 
 
@@ -125,10 +201,10 @@ def josa_ui(inp: str, *, descriptive: bool = False, verbose: bool = False) -> st
     Returns:
         String with josa_ui rule applied.
     """
-    rule = rule_id2text["5.4.2"]
     # 실제로 언중은 높은 확률로 조사 '의'는 [ㅔ]로 발음한다.
-    out = _JOSA_UI_RE.sub("에", inp) if descriptive else inp.replace("/J", "")
-    gloss(verbose, out, inp, rule)
+    out = inp.replace("의/J", "에") if descriptive else inp.replace("/J", "")
+    if verbose:
+        gloss(out, inp, _RULE_JOSA_UI)
     return out
 
 
@@ -143,10 +219,10 @@ def vowel_ui(inp: str, *, descriptive: bool = False, verbose: bool = False) -> s
     Returns:
         String with vowel_ui rule applied.
     """
-    rule = rule_id2text["5.4.1"]
     # 실제로 언중은 높은 확률로 단어의 첫음절 이외의 '의'는 [ㅣ]로 발음한다."""
     out = _VOWEL_UI_RE.sub(r"\1ᅵ", inp) if descriptive else inp
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, _RULE_VOWEL_UI)
     return out
 
 
@@ -161,15 +237,13 @@ def jamo(inp: str, *, descriptive: bool = False, verbose: bool = False) -> str:
     Returns:
         String with jamo simplification applied.
     """
-    rule = rule_id2text["16"]
-    out = inp
+    if not _contains_any(inp, _JAMO_TRIGGERS):
+        return inp
 
-    out = _JAMO_1_RE.sub(r"\1ᄉ", out)
-    out = _JAMO_2_RE.sub(r"\1ᄉ", out)
-    out = _JAMO_3_RE.sub(r"\1ᄀ", out)
-    out = _JAMO_4_RE.sub(r"\1ᄇ", out)
+    out = _JAMO_RE.sub(_jamo_repl, inp)
 
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, _RULE_JAMO)
     return out
 
     ############################ 어간 받침 ############################
@@ -186,12 +260,13 @@ def rieulgiyeok(inp: str, *, descriptive: bool = False, verbose: bool = False) -
     Returns:
         String with rieulgiyeok rule applied.
     """
-    rule = rule_id2text["11.1"]
+    if "ᆰ/P" not in inp:
+        return inp
 
-    out = inp
-    out = _RIEULGIYEOK_RE.sub(r"ᆯᄁ", out)
+    out = _RIEULGIYEOK_RE.sub("ᆯᄁ", inp)
 
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, _RULE_RIEULGIYEOK)
     return out
 
 
@@ -206,15 +281,13 @@ def rieulbieub(inp: str, *, descriptive: bool = False, verbose: bool = False) ->
     Returns:
         String with rieulbieub rule applied.
     """
-    rule = rule_id2text["25"]
-    out = inp
+    if not _contains_any(inp, _RIEULBIEUB_TRIGGERS):
+        return inp
 
-    out = _RIEULBIEUB_1_RE.sub(r"\1ᄁ", out)
-    out = _RIEULBIEUB_2_RE.sub(r"\1ᄄ", out)
-    out = _RIEULBIEUB_3_RE.sub(r"\1ᄊ", out)
-    out = _RIEULBIEUB_4_RE.sub(r"\1ᄍ", out)
+    out = _RIEULBIEUB_RE.sub(_rieulbieub_repl, inp)
 
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, _RULE_RIEULBIEUB)
     return out
 
 
@@ -229,23 +302,13 @@ def verb_nieun(inp: str, *, descriptive: bool = False, verbose: bool = False) ->
     Returns:
         String with verb_nieun rule applied.
     """
-    rule = rule_id2text["24"]
-    out = inp
+    if "/P" not in inp:
+        return inp
+
+    out = _VERB_NIEUN_RE.sub(_verb_nieun_repl, inp)
 
-    out = _VERB_NIEUN_1_RE.sub(r"\1ᄁ", out)
-    out = _VERB_NIEUN_2_RE.sub(r"\1ᄄ", out)
-    out = _VERB_NIEUN_3_RE.sub(r"\1ᄊ", out)
-    out = _VERB_NIEUN_4_RE.sub(r"\1ᄍ", out)
-    out = _VERB_NIEUN_5_RE.sub("ᆫᄁ", out)
-    out = _VERB_NIEUN_6_RE.sub("ᆫᄄ", out)
-    out = _VERB_NIEUN_7_RE.sub("ᆫᄊ", out)
-    out = _VERB_NIEUN_8_RE.sub("ᆫᄍ", out)
-    out = _VERB_NIEUN_9_RE.sub("ᆷᄁ", out)
-    out = _VERB_NIEUN_10_RE.sub("ᆷᄄ", out)
-    out = _VERB_NIEUN_11_RE.sub("ᆷᄊ", out)
-    out = _VERB_NIEUN_12_RE.sub("ᆷᄍ", out)
-
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, _RULE_VERB_NIEUN)
     return out
 
 
@@ -260,13 +323,16 @@ def balb(inp: str, *, descriptive: bool = False, verbose: bool = False) -> str:
     Returns:
         String with balb exceptions applied.
     """
-    rule = rule_id2text["10.1"]
+    if "ᆲ" not in inp:
+        return inp
+
     out = inp
 
     # exceptions
     out = _BALB_1_RE.sub(r"\1ᆸ\2", out)
     out = _BALB_2_RE.sub(r"\1ᆸ\2", out)
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, _RULE_BALB)
     return out
 
 
@@ -281,16 +347,13 @@ def palatalize(inp: str, *, descriptive: bool = False, verbose: bool = False) ->
     Returns:
         String with palatalization applied.
     """
-    rule = rule_id2text["17"]
-    out = inp
-
-    out = _PALATALIZE_1_RE.sub(r"ᄌ\1", out)
-    out = _PALATALIZE_2_RE.sub(r"ᄎ\1", out)
-    out = _PALATALIZE_3_RE.sub(r"ᆯᄎ\1", out)
+    if not _contains_any(inp, _PALATALIZE_TRIGGERS):
+        return inp
 
-    out = _PALATALIZE_4_RE.sub(r"ᄎ\1", out)
+    out = _PALATALIZE_RE.sub(_palatalize_repl, inp)
 
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, _RULE_PALATALIZE)
     return out
 
 
@@ -310,21 +373,62 @@ def modifying_rieul(
     Returns:
         String with modifying_rieul rule applied.
     """
-    rule = rule_id2text["27"]
-    out = inp
+    if "ᆯ" not in inp:
+        return inp
+
+    out = _MODIFYING_RIEUL_RE.sub(_modifying_rieul_repl, inp)
 
-    out = _MODIFYING_RIEUL_1_RE.sub(r"ᆯ ᄁ", out)
-    out = _MODIFYING_RIEUL_2_RE.sub(r"ᆯ ᄄ", out)
-    out = _MODIFYING_RIEUL_3_RE.sub(r"ᆯ ᄈ", out)
-    out = _MODIFYING_RIEUL_4_RE.sub(r"ᆯ ᄊ", out)
-    out = _MODIFYING_RIEUL_5_RE.sub(r"ᆯ ᄍ", out)
-    out = out.replace("ᆯ걸", "ᆯ껄")
-    out = out.replace("ᆯ밖에", "ᆯ빠께")
-    out = out.replace("ᆯ세라", "ᆯ쎄라")
-    out = out.replace("ᆯ수록", "ᆯ쑤록")
-    out = out.replace("ᆯ지라도", "ᆯ찌라도")
-    out = out.replace("ᆯ지언정", "ᆯ찌언정")
-    out = out.replace("ᆯ진대", "ᆯ찐대")
-
-    gloss(verbose, out, inp, rule)
+    if verbose:
+        gloss(out, inp, _RULE_MODIFYING_RIEUL)
+    return out
+
+
+_RULES = (
+    jyeo,
+    ye,
+    consonant_ui,
+    josa_ui,
+    vowel_ui,
+    jamo,
+    rieulgiyeok,
+    rieulbieub,
+    verb_nieun,
+    balb,
+    palatalize,
+    modifying_rieul,
+)
+
+
+def apply_all(inp: str, *, descriptive: bool = False, verbose: bool = False) -> str:
+    """Apply all special rules in order.
+
+    Gives the same result as calling each rule function in turn, but consecutive
+    rules that cannot interact share a single regex pass. With verbose=True, the
+    rules are applied one by one so that each transformation can be displayed.
+
+    Args:
+        inp: Input string with jamo and annotations.
+        descriptive: If True, also apply the descriptive rules.
+        verbose: If True, print transformation details.
+
+    Returns:
+        String with all special rules applied.
+    """
+    if verbose:
+        for func in _RULES:
+            inp = func(inp, descriptive=descriptive, verbose=verbose)
+        return inp
+
+    out = jyeo(inp)
+    out = ye(out, descriptive=descriptive)
+    out = consonant_ui(out)
+    out = josa_ui(out, descriptive=descriptive)
+    out = vowel_ui(out, descriptive=descriptive)
+    # jamo, rieulgiyeok, rieulbieub, verb_nieun
+    if _contains_any(out, _STEM_CODA_TRIGGERS):
+        out = _STEM_CODA_RE.sub(_stem_coda_repl, out)
+    out = balb(out)
+    # palatalize, modifying_rieul
+    if _contains_any(out, _PALATALIZE_MODIFYING_RIEUL_TRIGGERS):
+        out = _PALATALIZE_MODIFYING_RIEUL_RE.sub(_palatalize_modifying_rieul_repl, out)
     return out
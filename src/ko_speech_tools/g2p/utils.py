@@ -312,8 +312,11 @@ def get_rule_id2text() -> dict[str, str]:
     return rule_id2text
 
 
-def gloss(verbose: bool, out: str, inp: str, rule: str) -> None:  # noqa: FBT001
-    """Display the process and relevant information."""
-    if verbose and out != inp and out != _ANNOTATION_TAG_RE.sub("", inp):
+def gloss(out: str, inp: str, rule: str) -> None:
+    """Display the process and relevant information.
+
+    Callers check `verbose` themselves so that nothing is called otherwise.
+    """
+    if out != inp and out != _ANNOTATION_TAG_RE.sub("", inp):
         print(compose(inp), "->", compose(out))  # noqa: T201
         print("\033[1;31m", rule, "\033[0m")  # noqa: T201
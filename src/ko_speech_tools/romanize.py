@@ -13,7 +13,7 @@ The original functionality is maintained. Main changes include:
 - Update to modern Python standards.
 """
 
-import itertools
+import functools
 
 # fmt: off
 _REVISED_INITIALS = (
@@ -28,127 +28,76 @@ _REVISED_FINALS = (
     "", "g", "kk", "gs", "n", "nj", "nh", "d", "l", "lg", "lm", "lb", "ls", "lt",
     "lp", "lh", "m", "b", "bs", "s", "ss", "ng", "j", "ch", "k", "t", "p", "h"
 )
-# fmt: on
-
 
-def _academic_ambiguous_patterns() -> set[str]:
-    """Find final+initial combinations that can be split in multiple ways.
+# Final+initial combinations that can be split in more than one way, e.g. "kk" as
+# both ("k", "k") and ("kk", ""). Such syllable boundaries need a hyphen marker.
+_ACADEMIC_AMBIGUOUS_PATTERNS = frozenset({
+    "bss", "gss", "jj", "kk", "kkk", "lpp", "lss", "ltt", "njj", "pp", "ss", "sss",
+    "tt",
+})
+# fmt: on
 
-    For example, if "kk" can be split as both ("k", "k") and ("kk", ""),
-    it's ambiguous and needs a hyphen marker for clarity.
-    """
-    ambiguous = set()
-    for final, initial in itertools.product(_REVISED_FINALS, _REVISED_INITIALS):
-        combined = final + initial
-
-        # Count valid ways to split this combination (excluding boundaries)
-        split_count = 0
-        for i in range(len(combined)):
-            head, tail = combined[:i], combined[i:]
-            if head in _REVISED_FINALS and tail in _REVISED_INITIALS:
-                split_count += 1
-                if split_count > 1:
-                    ambiguous.add(combined)
-                    break
-
-    return ambiguous
-
-
-_ACADEMIC_AMBIGUOUS_PATTERNS = _academic_ambiguous_patterns()
-
-
-class _Syllable:
-    """Hangul syllable interface."""
-
-    MIN = ord("가")
-    MAX = ord("힣")
-
-    def __init__(self, char: str | None = None, code: int | None = None) -> None:
-        if char is None and code is None:
-            msg = "__init__ takes char or code as a keyword argument (not given)"
-            raise TypeError(msg)
-        if char is not None and code is not None:
-            msg = "__init__ takes char or code as a keyword argument (both given)"
-            raise TypeError(msg)
-        if char:
-            code = ord(char)
-        if not self.MIN <= code <= self.MAX:
-            msg = f"Expected Hangul syllable but {code} not in [{self.MIN}..{self.MAX}]"
-            raise TypeError(msg)
-        self.code = code
-
-    @property
-    def index(self) -> int:
-        return self.code - self.MIN
-
-    @property
-    def initial(self) -> int:
-        return self.index // 588
-
-    @property
-    def vowel(self) -> int:
-        return (self.index // 28) % 21
-
-    @property
-    def final(self) -> int:
-        return self.index % 28
-
-    @property
-    def char(self) -> str:
-        return chr(self.code)
-
-    def __str__(self) -> str:
-        return self.char
-
-    def __repr__(self) -> str:
-        return (
-            f"<Syllable({self.code}({self.char}),"
-            f"{self.initial},{self.vowel},{self.final})>"
+# Whether the academic transliteration marks the boundary between two syllables,
+# indexed by [final of the previous syllable][initial]. Syllables without an
+# initial are always marked. The extra last row is for the start of the text or
+# after non-syllable characters, which are never marked.
+_NO_PREVIOUS = len(_REVISED_FINALS)
+_ACADEMIC_MARKER = (
+    *(
+        tuple(
+            int(initial == "" or final + initial in _ACADEMIC_AMBIGUOUS_PATTERNS)
+            for initial in _REVISED_INITIALS
         )
+        for final in _REVISED_FINALS
+    ),
+    (0,) * len(_REVISED_INITIALS),
+)
 
+_SYLLABLE_MIN = ord("가")
+_SYLLABLE_MAX = ord("힣")
 
-def _academic(
-    char: str | None, syllable: _Syllable | None, prev_syllable: _Syllable | None
-) -> str | None:
-    """Rule for academic transliteration."""
-    if not syllable:
-        return char
 
-    marker = prev_syllable and (
-        _REVISED_INITIALS[syllable.initial] == ""
-        or (_REVISED_FINALS[prev_syllable.final] + _REVISED_INITIALS[syllable.initial])
-        in _ACADEMIC_AMBIGUOUS_PATTERNS
-    )
+@functools.cache
+def _syllable_table() -> tuple[tuple[int, int, tuple[bytes, bytes]], ...]:
+    """Return (initial, final, romanizations) for each syllable, built on first use.
 
-    result = "-" if marker else ""
-    result += (
-        _REVISED_INITIALS[syllable.initial]
-        + _REVISED_VOWELS[syllable.vowel]
-        + _REVISED_FINALS[syllable.final]
-    )
-    return result
+    Indexed by the code point offset from the first Hangul syllable. The
+    romanizations are ASCII bytes without and with a leading boundary marker.
+    """
+    table = []
+    for index in range(_SYLLABLE_MAX - _SYLLABLE_MIN + 1):
+        initial, vowel, final = index // 588, (index // 28) % 21, index % 28
+        romanized = (
+            _REVISED_INITIALS[initial] + _REVISED_VOWELS[vowel] + _REVISED_FINALS[final]
+        ).encode("ascii")
+        table.append((initial, final, (romanized, b"-" + romanized)))
+    return tuple(table)
 
 
+@functools.lru_cache(maxsize=8192)
 def hangul_romanize(text: str) -> str:
     """Transliterate to romanized text.
 
+    Results are cached, since the same short words tend to recur.
+
     >>> hangul_romanize("물엿")
     'mul-yeos'
     """
-    result = []
-    prev_syllable = None
+    table = _syllable_table()
+    # The romanization is pure ASCII, so collect UTF-8 bytes instead of a list of
+    # small strings. Surrogates in the input are passed through unchanged.
+    result = bytearray()
+    prev_final = _NO_PREVIOUS
 
     for c in text:
-        try:
-            syllable = _Syllable(c)
-        except TypeError:
-            result.append(c)
-            prev_syllable = None
+        index = ord(c) - _SYLLABLE_MIN
+        if not 0 <= index <= _SYLLABLE_MAX - _SYLLABLE_MIN:
+            result += c.encode("utf-8", "surrogatepass")
+            prev_final = _NO_PREVIOUS
             continue
 
-        romanized = _academic(c, syllable, prev_syllable)
-        if romanized:
-            result.append(romanized)
-        prev_syllable = syllable
+        initial, final, romanizations = table[index]
+        result += romanizations[_ACADEMIC_MARKER[prev_final][initial]]
+        prev_final = final
 
-    return "".join(result)
+    return result.decode("utf-8", "surrogatepass")
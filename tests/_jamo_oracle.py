@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2025 Enno Hermann
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Reference classification of jamo code points for the tests.
+
+Written directly from the Unicode charts, independently of ko_speech_tools.jamo.
+"""
+
+# Code point ranges of all jamo, as (start, stop) with stop exclusive.
+JAMO_RANGES = (
+    # See http://www.unicode.org/charts/PDF/U1100.pdf
+    (0x1100, 0x1200),
+    # See http://www.unicode.org/charts/PDF/U3130.pdf
+    (0x3131, 0x318F),
+    # See http://www.unicode.org/charts/PDF/UA960.pdf
+    (0xA960, 0xA97D),
+    # See http://www.unicode.org/charts/PDF/UD7B0.pdf
+    (0xD7B0, 0xD7FC),
+)
+# Code points within JAMO_RANGES that are not jamo: the HCJ filler U+3164 and
+# the unassigned gap in Jamo Extended-B.
+JAMO_HOLES = frozenset((0x3164, *range(0xD7C7, 0xD7CB)))
+
+HCJ_RANGES = ((0x3131, 0x318F),)
+HCJ_HOLES = frozenset((0x3164,))
+# HCJ that corresponds to U+11xx jamo in modern usage
+HCJ_MODERN_RANGES = ((0x3131, 0x3164),)
+# Modern U+11xx leads, vowels and tails, and modern HCJ. The vowel filler U+1160
+# is not modern.
+JAMO_MODERN_RANGES = (
+    (0x1100, 0x1113),
+    (0x1161, 0x1176),
+    (0x11A8, 0x11C3),
+    *HCJ_MODERN_RANGES,
+)
+
+# Jamo by class. The fillers U+115F and U+1160 have a class. HCJ vowels are
+# unambiguous and count as vowels, HCJ consonants have no class.
+JAMO_CLASS_RANGES = {
+    "lead": ((0x1100, 0x1160),),
+    "vowel": ((0x1160, 0x11A8), (0x314F, 0x3164)),
+    "tail": ((0x11A8, 0x1200),),
+}
+
+
+def _two_stage_table(ranges, holes=frozenset()):
+    """Build a two-stage bitmap of the BMP code points in ranges, except holes.
+
+    The high byte of a code point selects a 32-byte leaf in the second stage, the
+    low byte a bit in that leaf. Blocks without any of the code points share the
+    empty leaf at index 0. The lowest code point is stored as well, so that
+    everything below it, including all ASCII, is rejected without a lookup.
+    """
+    leaves = {}
+    for start, stop in ranges:
+        for code in range(start, stop):
+            if code in holes:
+                continue
+            leaf = leaves.setdefault(code >> 8, bytearray(32))
+            leaf[(code >> 3) & 31] |= 1 << (code & 7)
+    blocks = bytearray(256)
+    for index, block in enumerate(leaves, 1):
+        blocks[block] = index
+    first = min(start for start, _ in ranges)
+    return first, bytes(blocks), (bytes(32), *map(bytes, leaves.values()))
+
+
+def _lookup(table, code: int) -> bool:
+    first, blocks, leaves = table
+    if not first <= code <= 0xFFFF:
+        return False
+    return bool(leaves[blocks[code >> 8]][(code >> 3) & 31] & (1 << (code & 7)))
+
+
+_JAMO_TABLE = _two_stage_table(JAMO_RANGES, JAMO_HOLES)
+_JAMO_MODERN_TABLE = _two_stage_table(JAMO_MODERN_RANGES)
+_HCJ_TABLE = _two_stage_table(HCJ_RANGES, HCJ_HOLES)
+_HCJ_MODERN_TABLE = _two_stage_table(HCJ_MODERN_RANGES)
+_JAMO_CLASS_TABLES = {
+    jamo_class: _two_stage_table(ranges)
+    for jamo_class, ranges in JAMO_CLASS_RANGES.items()
+}
+
+
+def is_jamo(code: int) -> bool:
+    """Test if a code point is a modern or archaic jamo or HCJ."""
+    return _lookup(_JAMO_TABLE, code)
+
+
+def is_jamo_modern(code: int) -> bool:
+    """Test if a code point is a modern U+11xx jamo or modern HCJ."""
+    return _lookup(_JAMO_MODERN_TABLE, code)
+
+
+def is_hcj(code: int) -> bool:
+    """Test if a code point is HCJ."""
+    return _lookup(_HCJ_TABLE, code)
+
+
+def is_hcj_modern(code: int) -> bool:
+    """Test if a code point is modern HCJ."""
+    return _lookup(_HCJ_MODERN_TABLE, code)
+
+
+def get_jamo_class(code: int) -> str | None:
+    """Return the class of a jamo code point, or None if it has none."""
+    for jamo_class, table in _JAMO_CLASS_TABLES.items():
+        if _lookup(table, code):
+            return jamo_class
+    return None
@@ -7,6 +7,8 @@ import pytest
 
 from ko_speech_tools import G2p
 from ko_speech_tools.g2p.numerals import convert_num, process_num
+from ko_speech_tools.g2p.special import _RULES, apply_all
+from ko_speech_tools.jamo import h2j
 
 
 @pytest.fixture
@@ -36,6 +38,27 @@ def test_g2p(g2p, text, expected):
     assert g2p(text) == expected
 
 
+@pytest.mark.parametrize("descriptive", [False, True])
+@pytest.mark.parametrize(
+    "text",
+    [
+        "신/P고 앉/P다",
+        "넓/P게 핥/P지",
+        "맑/P게 긁/P고",
+        "밟/P다 같이 굳이",
+        "할/E 수 만날/E 사람",
+        "져 계 희의/J 무늬",
+    ],
+)
+def test_apply_all(text, descriptive):
+    """apply_all gives the same result as applying each special rule in turn."""
+    inp = h2j(text)
+    expected = inp
+    for func in _RULES:
+        expected = func(expected, descriptive=descriptive)
+    assert apply_all(inp, descriptive=descriptive) == expected
+
+
 def test_numerals():
     assert process_num("123,456,789", sino=True) == "일억이천삼백사십오만육천칠백팔십구"
     assert (
@@ -7,9 +7,16 @@
 Source:
 https://github.com/youknowone/hangul-romanize"""
 
+import itertools
+
 import pytest
 
 from ko_speech_tools import hangul_romanize
+from ko_speech_tools.romanize import (
+    _ACADEMIC_AMBIGUOUS_PATTERNS,
+    _REVISED_FINALS,
+    _REVISED_INITIALS,
+)
 
 
 @pytest.mark.parametrize(
@@ -40,3 +47,19 @@ from ko_speech_tools import hangul_romanize
 )
 def test_hangul_romanize(text, expected):
     assert hangul_romanize(text) == expected
+
+
+def test_academic_ambiguous_patterns():
+    """The hardcoded patterns match all final+initial combinations with more
+    than one valid split."""
+    ambiguous = set()
+    for final, initial in itertools.product(_REVISED_FINALS, _REVISED_INITIALS):
+        combined = final + initial
+        splits = [
+            (combined[:i], combined[i:])
+            for i in range(len(combined))
+            if combined[:i] in _REVISED_FINALS and combined[i:] in _REVISED_INITIALS
+        ]
+        if len(splits) > 1:
+            ambiguous.add(combined)
+    assert ambiguous == _ACADEMIC_AMBIGUOUS_PATTERNS
@@ -15,6 +15,7 @@ import unittest
 import pytest
 
 from ko_speech_tools import jamo
+from tests import _jamo_oracle as oracle
 
 # Corresponding HCJ for all valid leads in modern Hangul.
 _HCJ_LEADS_MODERN = list("ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
@@ -25,16 +26,246 @@ _HCJ_VOWELS_MODERN = [chr(_) for _ in range(0x314F, 0x3164)]
 # Corresponding HCJ for all valid tails in modern Hangul.
 _HCJ_TAILS_MODERN = "ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
 
+# Reference conversion of modern U+11xx jamo to HCJ
+_JAMO_TO_HCJ_MODERN = str.maketrans(
+    dict(
+        zip(
+            itertools.chain(
+                jamo.JAMO_LEADS_MODERN, jamo.JAMO_VOWELS_MODERN, jamo.JAMO_TAILS_MODERN
+            ),
+            itertools.chain(_HCJ_LEADS_MODERN, _HCJ_VOWELS_MODERN, _HCJ_TAILS_MODERN),
+            strict=True,
+        )
+    )
+)
+# Reference conversion of modern HCJ to U+11xx jamo of each class
+_HCJ_TO_JAMO_MODERN = {
+    (jamo_class, hcj): jamo_char
+    for jamo_class, hcj_chars, jamo_chars in (
+        ("lead", _HCJ_LEADS_MODERN, jamo.JAMO_LEADS_MODERN),
+        ("vowel", _HCJ_VOWELS_MODERN, jamo.JAMO_VOWELS_MODERN),
+        ("tail", _HCJ_TAILS_MODERN, jamo.JAMO_TAILS_MODERN),
+    )
+    for hcj, jamo_char in zip(hcj_chars, jamo_chars, strict=True)
+}
+
+# All characters in the jamo blocks
+# See http://www.unicode.org/charts/PDF/U1100.pdf
+_ALL_VALID_JAMO = "".join(map(chr, range(0x1100, 0x1200)))
+# See http://www.unicode.org/charts/PDF/U3130.pdf
+_ALL_VALID_HCJ_MODERN = "".join(map(chr, range(0x3131, 0x3164)))
+_ALL_VALID_HCJ_ARCHAIC = "".join(map(chr, range(0x3165, 0x318F)))
+# See http://www.unicode.org/charts/PDF/UA960.pdf
+_ALL_VALID_EXT_A = "".join(map(chr, range(0xA960, 0xA97D)))
+# See http://www.unicode.org/charts/PDF/UD7B0.pdf
+_ALL_VALID_EXT_B = "".join(
+    map(chr, itertools.chain(range(0xD7B0, 0xD7C7), range(0xD7CB, 0xD7FC)))
+)
+
+# All U+11xx jamo by class. Note: Fillers are considered initial consonants
+# according to www.unicode.org/charts/PDF/U1100.pdf
+_ALL_LEADS = "".join(map(chr, range(0x1100, 0x1160)))
+_ALL_VOWELS = "".join(map(chr, range(0x1160, 0x11A8)))
+_ALL_TAILS = "".join(map(chr, range(0x11A8, 0x1200)))
+
 # Common invalid test data (non-jamo characters)
 _INVALID_CHARS_BASE = "abABzyZY ,.:;~`―—–/!@#$%^&*()[]{}"  # noqa: RUF001
 
+# Characters just outside the valid ranges of each predicate
+# fmt: off
+_INVALID_EDGE_CASES_JAMO = frozenset(map(chr, (
+    0x10FF, 0x1200, 0x3130, 0x3164, 0x318F, 0xA95F, 0xA07D, 0xD7AF, 0xD7C7, 0xD7CA,
+    0xD7FC,
+)))
+# fmt: on
+_INVALID_EDGE_CASES_JAMO_MODERN = frozenset(
+    map(chr, (0x10FF, 0x1113, 0x1160, 0x1176, 0x11A7, 0x11C3))
+)
+_INVALID_EDGE_CASES_HCJ = frozenset(map(chr, (0x3130, 0x3164, 0x318F)))
+_INVALID_EDGE_CASES_HCJ_MODERN = frozenset(map(chr, (0x3130, 0x3164)))
+_INVALID_EDGE_CASES_HANGUL = frozenset(map(chr, (0xABFF, 0xD7A4)))
+
+
+# All valid modern Hangul characters
+_VALID_HANGUL = tuple(map(chr, range(0xAC00, 0xD7A4)))
+
 
 def _get_random_hangul(count=(0xD7A4 - 0xAC00)):
     """Generate a sequence of random, unique, valid Hangul characters.
     Returns all possible modern Hangul characters by default.
     """
-    valid_hangul = [chr(_) for _ in range(0xAC00, 0xD7A4)]
-    return random.sample(valid_hangul, count)
+    return random.sample(_VALID_HANGUL, count)
+
+
+# Hangul characters that are invalid input for most tests, sampled once per run
+_RANDOM_HANGUL = tuple(_get_random_hangul(20))
+
+# Modern and archaic jamo compounds, and jamo that are not compounds
+_VALID_COMPOUNDS = tuple(
+    "ᄁᄄᄈᄊᄍᄓᄔᄕᄖᄗᄘᄙᄚᄛᄜᄝᄞᄟᄠᄡᄢᄣᄤᄥᄦᄧᄨᄩᄪᄫᄬᄭᄮᄯᄰᄱᄲᄳᄴᄵᄶᄷᄸᄹᄺᄻᄽᄿ"
+    "ᅁᅂᅃᅄᅅᅆᅇᅈᅉᅊᅋᅍᅏᅑᅒᅓᅖᅗᅘᅚᅛᅜᅝᅞᅪᅫᅬᅯᅰᅱᅴᅶᅷᅸᅹᅺᅻᅼᅽᅾᅿᆀᆁᆂᆃᆄᆅᆆ"
+    "ᆇᆈᆉᆊᆋᆌᆍᆎᆏᆐᆑᆒᆓᆔᆕᆖᆗᆘᆙᆚᆛᆜᆝᆟᆠᆡᆢᆣᆤᆥᆦᆧᆩᆪᆬᆭᆰᆱᆲᆳᆴᆵᆶᆹᆻᇃᇄᇅ"
+    "ᇆᇇᇈᇉᇊᇋᇌᇍᇎᇏᇐᇑᇒᇓᇔᇕᇖᇗᇘᇙᇚᇛᇜᇝᇞᇟᇠᇡᇢᇣᇤᇥᇦᇧᇨᇩᇪᇬᇭᇮᇯᇱᇲᇳᇴᇵᇶᇷ"
+    "ᇸᇺᇻᇼᇽᇾᇿㄲㄳㄵㄶㄸㄺㄻㄼㄽㄾㄿㅀㅃㅄㅆㅉㅘㅙㅚㅝㅞㅟㅢㅥㅦㅧㅨㅩㅪㅫㅬㅭㅮㅯㅰㅱㅲㅳㅴㅵㅶ"
+    "ㅷㅸㅹㅺㅻㅼㅽㅾㆀㆂㆃㆄㆅㆇㆈㆉㆊㆋㆌㆎꥠꥡꥢꥣꥤꥥꥦꥧꥨꥩꥪꥫꥬꥭꥮꥯꥰꥱꥲꥳꥴꥵꥶꥷꥸꥹꥺ"
+    "ꥻꥼힰힱힲힳힴힵힶힷힸힹힺힻힼힽힾힿퟀퟁퟂퟃퟄퟅퟆퟋퟌퟍퟎퟏퟐퟑퟒퟓퟔퟕퟖퟗퟘퟙퟚퟛퟜퟝퟞퟟퟠퟡ"
+    "ퟢퟣퟤퟥퟦퟧퟨퟩퟪퟫퟬퟭퟮퟯퟰퟱퟲퟳퟴퟵퟶퟷퟸퟹퟺퟻᅢᅤᅦᅨㅐㅒㅔㅖ"
+)
+_NON_COMPOUND_JAMO = tuple(
+    "ᄀᄂᄃᄅᄆᄇᄉᄋᄌᄎᄏᄐᄑᄒᄼᄾᅀᅌᅎᅐᅔᅕᅟᅠᅡᅣᅥᅧᅩᅭᅮᅲᅳᅵᆞᆨᆫᆮᆯᆷᆸᆺᆼᆽᆾᆿ"
+    "ᇀᇁᇂᇫᇰㄱㄴㄷㄹㅁ ㅂㅅㅇㅈㅊㅋㅌㅍㅎㅏㅑㅓㅕㅗㅛㅜㅠㅡㅣㅿㆁㆍ"
+)
+
+
+def _misclassified(predicate, chars, *, expected):
+    """Return the code points of all characters that predicate misclassifies.
+
+    Only used to build assertion messages, so it only runs on failure.
+    """
+    return [f"U+{ord(_):X}" for _ in chars if predicate(_) is not expected]
+
+
+# Positive tests, one case per block so that a failure in one doesn't hide the
+# others.
+@pytest.mark.parametrize(
+    "chars",
+    [
+        pytest.param(_ALL_VALID_JAMO, id="jamo"),
+        pytest.param(_ALL_VALID_HCJ_MODERN + _ALL_VALID_HCJ_ARCHAIC, id="hcj"),
+        pytest.param(_ALL_VALID_EXT_A, id="ext_a"),
+        pytest.param(_ALL_VALID_EXT_B, id="ext_b"),
+    ],
+)
+def test_is_jamo_valid(chars):
+    assert all(map(jamo.is_jamo, chars)), (
+        "Incorrectly decided these were not jamo: "
+        f"{_misclassified(jamo.is_jamo, chars, expected=True)}"
+    )
+
+
+@pytest.mark.parametrize(
+    "chars",
+    [
+        pytest.param(jamo.JAMO_LEADS_MODERN, id="leads"),
+        pytest.param(jamo.JAMO_VOWELS_MODERN, id="vowels"),
+        pytest.param(jamo.JAMO_TAILS_MODERN, id="tails"),
+        pytest.param(_HCJ_LEADS_MODERN, id="hcj_leads"),
+        pytest.param(_HCJ_VOWELS_MODERN, id="hcj_vowels"),
+        pytest.param(_HCJ_TAILS_MODERN, id="hcj_tails"),
+    ],
+)
+def test_is_jamo_modern_valid(chars):
+    assert all(map(jamo.is_jamo_modern, chars)), (
+        "Incorrectly decided these were not modern jamo: "
+        f"{_misclassified(jamo.is_jamo_modern, chars, expected=True)}"
+    )
+
+
+def _get_jamo_class_or_none(char):
+    try:
+        return jamo.get_jamo_class(char)
+    except jamo.InvalidJamoError:
+        return None
+
+
+@pytest.mark.parametrize(
+    ("func", "reference"),
+    [
+        (jamo.is_jamo, oracle.is_jamo),
+        (jamo.is_jamo_modern, oracle.is_jamo_modern),
+        (jamo.is_hcj, oracle.is_hcj),
+        (jamo.is_hcj_modern, oracle.is_hcj_modern),
+        (_get_jamo_class_or_none, oracle.get_jamo_class),
+    ],
+    ids=["is_jamo", "is_jamo_modern", "is_hcj", "is_hcj_modern", "get_jamo_class"],
+)
+def test_jamo_classification_bmp(func, reference):
+    """Compare with the reference for every code point in the BMP.
+
+    Collects all mismatches as {code point: (result, expected)}.
+    """
+    mismatches = {
+        f"U+{code:04X}": (trial, target)
+        for code in range(0x10000)
+        if (trial := func(chr(code))) != (target := reference(code))
+    }
+    assert not mismatches
+
+
+# Note: The chaeum filler U+3164 is not considered HCJ, but a special
+# character as defined in http://www.unicode.org/charts/PDF/U3130.pdf.
+@pytest.mark.parametrize(
+    "chars",
+    [
+        pytest.param(_ALL_VALID_HCJ_MODERN, id="modern"),
+        pytest.param(_ALL_VALID_HCJ_ARCHAIC, id="archaic"),
+    ],
+)
+def test_is_hcj_valid(chars):
+    assert all(map(jamo.is_hcj, chars)), (
+        "Incorrectly decided these were not hcj: "
+        f"{_misclassified(jamo.is_hcj, chars, expected=True)}"
+    )
+
+
+def test_is_hcj_modern_valid():
+    assert all(map(jamo.is_hcj_modern, _ALL_VALID_HCJ_MODERN)), (
+        "Incorrectly decided these were not modern hcj: "
+        f"{_misclassified(jamo.is_hcj_modern, _ALL_VALID_HCJ_MODERN, expected=True)}"
+    )
+
+
+@pytest.mark.parametrize(
+    "chars",
+    [
+        pytest.param("가나다한글한극어힣", id="hardcoded"),
+        pytest.param(_VALID_HANGUL, id="all"),
+    ],
+)
+def test_is_hangul_char_valid(chars):
+    assert all(map(jamo.is_hangul_char, chars)), (
+        "Incorrectly decided these were not a hangul character: "
+        f"{_misclassified(jamo.is_hangul_char, chars, expected=True)}"
+    )
+
+
+@pytest.mark.parametrize(
+    ("chars", "target"),
+    [(_ALL_LEADS, "lead"), (_ALL_VOWELS, "vowel"), (_ALL_TAILS, "tail")],
+)
+def test_get_jamo_class_valid(chars, target):
+    for test in chars:
+        trial = jamo.get_jamo_class(test)
+        assert trial == target, (
+            f"Incorrectly decided {ord(test):X} was a {trial}. (it's a {target})"
+        )
+
+
+_JAMO_PREDICATES = [
+    jamo.is_jamo,
+    jamo.is_jamo_modern,
+    jamo.is_hcj,
+    jamo.is_hcj_modern,
+    jamo.is_jamo_compound,
+]
+
+
+@pytest.mark.parametrize("predicate", _JAMO_PREDICATES, ids=lambda _: _.__name__)
+def test_rejects_hangul(predicate):
+    assert not any(map(predicate, _RANDOM_HANGUL)), (
+        f"{predicate.__name__} incorrectly accepted these: "
+        f"{_misclassified(predicate, _RANDOM_HANGUL, expected=False)}"
+    )
+
+
+@pytest.mark.parametrize(
+    "predicate", [*_JAMO_PREDICATES, jamo.is_hangul_char], ids=lambda _: _.__name__
+)
+def test_rejects_non_jamo(predicate):
+    assert not any(map(predicate, _INVALID_CHARS_BASE)), (
+        f"{predicate.__name__} incorrectly accepted these: "
+        f"{_misclassified(predicate, _INVALID_CHARS_BASE, expected=False)}"
+    )
 
 
 class TestJamo(unittest.TestCase):
@@ -45,43 +276,13 @@ class TestJamo(unittest.TestCase):
         Non-assigned code points are invalid.
         """
 
-        # See http://www.unicode.org/charts/PDF/U1100.pdf
-        valid_jamo = (chr(_) for _ in range(0x1100, 0x1200))
-        # See http://www.unicode.org/charts/PDF/U3130.pdf
-        valid_hcj = itertools.chain(
-            (chr(_) for _ in range(0x3131, 0x3164)),
-            (chr(_) for _ in range(0x3165, 0x318F)),
-        )
-        # See http://www.unicode.org/charts/PDF/UA960.pdf
-        valid_ext_a = (chr(_) for _ in range(0xA960, 0xA97D))
-        # See http://www.unicode.org/charts/PDF/UD7B0.pdf
-        valid_ext_b = itertools.chain(
-            (chr(_) for _ in range(0xD7B0, 0xD7C7)),
-            (chr(_) for _ in range(0xD7CB, 0xD7FC)),
-        )
-
-        invalid_edge_cases = (
-            chr(0x10FF),
-            chr(0x1200),
-            chr(0x3130),
-            chr(0x3164),
-            chr(0x318F),
-            chr(0xA95F),
-            chr(0xA07D),
-            chr(0xD7AF),
-            chr(0xD7C7),
-            chr(0xD7CA),
-            chr(0xD7FC),
+        # Negative tests, see test_is_jamo_valid for the positive ones and
+        # test_rejects_hangul/test_rejects_non_jamo for common invalid input
+        invalid = "".join(_INVALID_EDGE_CASES_JAMO)
+        assert not any(map(jamo.is_jamo, invalid)), (
+            "Incorrectly decided these were jamo: "
+            f"{_misclassified(jamo.is_jamo, invalid, expected=False)}"
         )
-        invalid_hangul = _get_random_hangul(20)
-        invalid_other = _INVALID_CHARS_BASE
-
-        # Positive tests
-        for _ in itertools.chain(valid_jamo, valid_hcj, valid_ext_a, valid_ext_b):
-            assert jamo.is_jamo(_), f"Incorrectly decided U+{ord(_):X} was not jamo."
-        # Negative tests
-        for _ in itertools.chain(invalid_edge_cases, invalid_hangul, invalid_other):
-            assert not jamo.is_jamo(_), f"Incorrectly decided U+{ord(_):X} was jamo."
 
     def test_is_jamo_modern(self):
         """is_jamo_modern tests
@@ -89,34 +290,17 @@ class TestJamo(unittest.TestCase):
         Modern jamo includes all U+11xx jamo in addition to HCJ in usage.
         """
 
-        modern_jamo = itertools.chain(
-            jamo.JAMO_LEADS_MODERN, jamo.JAMO_VOWELS_MODERN, jamo.JAMO_TAILS_MODERN
-        )
-        modern_hcj = itertools.chain(
-            _HCJ_LEADS_MODERN, _HCJ_VOWELS_MODERN, _HCJ_TAILS_MODERN
-        )
+        invalid_other = "ᄓ"
 
-        invalid_edge_cases = (
-            chr(0x10FF),
-            chr(0x1113),
-            chr(0x1160),
-            chr(0x1176),
-            chr(0x11A7),
-            chr(0x11C3),
+        # Negative tests, see test_is_jamo_modern_valid for the positive ones and
+        # test_rejects_hangul/test_rejects_non_jamo for common invalid input
+        invalid = "".join(
+            itertools.chain(_INVALID_EDGE_CASES_JAMO_MODERN, invalid_other)
+        )
+        assert not any(map(jamo.is_jamo_modern, invalid)), (
+            "Incorrectly decided these were modern jamo: "
+            f"{_misclassified(jamo.is_jamo_modern, invalid, expected=False)}"
         )
-        invalid_hangul = _get_random_hangul(20)
-        invalid_other = _INVALID_CHARS_BASE + "ᄓ"
-
-        # Positive tests
-        for _ in itertools.chain(modern_jamo, modern_hcj):
-            assert jamo.is_jamo_modern(_), (
-                f"Incorrectly decided U+{ord(_):X} was not modern jamo."
-            )
-        # Negative tests
-        for _ in itertools.chain(invalid_edge_cases, invalid_hangul, invalid_other):
-            assert not jamo.is_jamo_modern(_), (
-                f"Incorrectly decided U+{ord(_):X} was modern jamo."
-            )
 
     def test_is_hcj(self):
         """is_hcj tests
@@ -125,23 +309,15 @@ class TestJamo(unittest.TestCase):
         code points.
         """
 
-        # Note: The chaeum filler U+3164 is not considered HCJ, but a special
-        # character as defined in http://www.unicode.org/charts/PDF/U3130.pdf.
-        valid_hcj = itertools.chain(
-            (chr(_) for _ in range(0x3131, 0x3164)),
-            (chr(_) for _ in range(0x3165, 0x318F)),
-        )
+        invalid_other = "ᄀᄓᅡᅶᆨᇃᇿ"
 
-        invalid_edge_cases = (chr(0x3130), chr(0x3164), chr(0x318F))
-        invalid_hangul = _get_random_hangul(20)
-        invalid_other = _INVALID_CHARS_BASE + "ᄀᄓᅡᅶᆨᇃᇿ"
-
-        # Positive tests
-        for _ in valid_hcj:
-            assert jamo.is_hcj(_), f"Incorrectly decided U+{ord(_):X} was not hcj."
-        # Negative tests
-        for _ in itertools.chain(invalid_edge_cases, invalid_hangul, invalid_other):
-            assert not jamo.is_hcj(_), f"Incorrectly decided U+{ord(_):X} was hcj."
+        # Negative tests, see test_is_hcj_valid for the positive ones and
+        # test_rejects_hangul/test_rejects_non_jamo for common invalid input
+        invalid = "".join(itertools.chain(_INVALID_EDGE_CASES_HCJ, invalid_other))
+        assert not any(map(jamo.is_hcj, invalid)), (
+            "Incorrectly decided these were hcj: "
+            f"{_misclassified(jamo.is_hcj, invalid, expected=False)}"
+        )
 
     def test_is_hcj_modern(self):
         """is_hcj_modern tests
@@ -150,24 +326,17 @@ class TestJamo(unittest.TestCase):
         character in modern usage.
         """
 
-        # Note: The chaeum filler U+3164 is not considered HCJ, but a special
-        # character as defined in http://www.unicode.org/charts/PDF/U3130.pdf.
-        valid_hcj_modern = (chr(_) for _ in range(0x3131, 0x3164))
-
-        invalid_edge_cases = (chr(0x3130), chr(0x3164))
-        invalid_hangul = _get_random_hangul(20)
-        invalid_other = _INVALID_CHARS_BASE + "ᄀᄓᅡᅶᆨᇃᇿㆎㅥ"
+        invalid_other = "ᄀᄓᅡᅶᆨᇃᇿㆎㅥ"
 
-        # Positive tests
-        for _ in valid_hcj_modern:
-            assert jamo.is_hcj_modern(_), (
-                f"Incorrectly decided U+{ord(_):X} was not modern hcj."
-            )
-        # Negative tests
-        for _ in itertools.chain(invalid_edge_cases, invalid_hangul, invalid_other):
-            assert not jamo.is_hcj_modern(_), (
-                f"Incorrectly decided U+{ord(_):X} was modern hcj."
-            )
+        # Negative tests, see test_is_hcj_modern_valid for the positive ones and
+        # test_rejects_hangul/test_rejects_non_jamo for common invalid input
+        invalid = "".join(
+            itertools.chain(_INVALID_EDGE_CASES_HCJ_MODERN, invalid_other)
+        )
+        assert not any(map(jamo.is_hcj_modern, invalid)), (
+            "Incorrectly decided these were modern hcj: "
+            f"{_misclassified(jamo.is_hcj_modern, invalid, expected=False)}"
+        )
 
     def test_is_hangul_char(self):
         """is_hangul_char tests
@@ -175,19 +344,15 @@ class TestJamo(unittest.TestCase):
         excluding unassigned codes.
         """
 
-        hardcoded_tests = "가나다한글한극어힣"
-
-        invalid_edge_cases = (chr(0xABFF), chr(0xD7A4))
-        invalid_other = "ㄱㄴㅓ" + _INVALID_CHARS_BASE + "ᄀᄓᅡᅶᆨᇃᇿㆎㅥ"
+        invalid_other = "ㄱㄴㅓᄀᄓᅡᅶᆨᇃᇿㆎㅥ"
 
-        for _ in itertools.chain(hardcoded_tests, _get_random_hangul(1024)):
-            assert jamo.is_hangul_char(_), (
-                f"Incorrectly decided U+{ord(_):X} was not a hangul character."
-            )
-        for _ in itertools.chain(invalid_edge_cases, invalid_other):
-            assert not jamo.is_hangul_char(_), (
-                f"Incorrectly decided U+{ord(_):X} was a hangul character."
-            )
+        # Negative tests, see test_is_hangul_char_valid for the positive ones and
+        # test_rejects_non_jamo for common invalid input
+        invalid = "".join(itertools.chain(_INVALID_EDGE_CASES_HANGUL, invalid_other))
+        assert not any(map(jamo.is_hangul_char, invalid)), (
+            "Incorrectly decided these were a hangul character: "
+            f"{_misclassified(jamo.is_hangul_char, invalid, expected=False)}"
+        )
 
     def test_get_jamo_class(self):
         """get_jamo_class tests
@@ -200,32 +365,10 @@ class TestJamo(unittest.TestCase):
         Note: strict adherence to Unicode 7.0
         """
 
-        # Note: Fillers are considered initial consonants according to
-        # www.unicode.org/charts/PDF/U1100.pdf
-        leads = (chr(_) for _ in range(0x1100, 0x1160))
-        lead_targets = ("lead" for _ in range(0x1100, 0x1160))
-        vowels = (chr(_) for _ in range(0x1160, 0x11A8))
-        vowel_targets = ("vowel" for _ in range(0x1160, 0x11A8))
-        tails = (chr(_) for _ in range(0x11A8, 0x1200))
-        tail_targets = ("tail" for _ in range(0x11A8, 0x1200))
-
         invalid_cases = [chr(0x10FF), chr(0x1200), "a", "~"]
         invalid_other_cases = ["", "ᄂᄃ"]
 
-        all_tests = itertools.chain(
-            zip(leads, lead_targets, strict=True),
-            zip(vowels, vowel_targets, strict=True),
-            zip(tails, tail_targets, strict=True),
-        )
-
-        # Test characters
-        for test, target in all_tests:
-            trial = jamo.get_jamo_class(test)
-            assert trial == target, (
-                f"Incorrectly decided {ord(test):X} was a {trial}. (it's a {target})"
-            )
-
-        # Negative tests
+        # Negative tests, see test_get_jamo_class_valid for the positive ones
         for _ in invalid_cases:
             with pytest.raises(jamo.InvalidJamoError):
                 jamo.get_jamo_class(_)
@@ -242,12 +385,14 @@ class TestJamo(unittest.TestCase):
         character into U+31xx HCJ in a given input. Anything else is unchanged.
         """
 
-        test_chars = itertools.chain(
-            jamo.JAMO_LEADS_MODERN, jamo.JAMO_VOWELS_MODERN, jamo.JAMO_TAILS_MODERN
-        )
-        target_chars = itertools.chain(
-            _HCJ_LEADS_MODERN, _HCJ_VOWELS_MODERN, _HCJ_TAILS_MODERN
-        )
+        # Every modern jamo on its own and all of them in one string
+        test_modern = [
+            *jamo.JAMO_LEADS_MODERN,
+            *jamo.JAMO_VOWELS_MODERN,
+            *jamo.JAMO_TAILS_MODERN,
+        ]
+        test_modern.append("".join(test_modern))
+        target_modern = [_.translate(_JAMO_TO_HCJ_MODERN) for _ in test_modern]
         # TODO: Complete archaic jamo coverage
         test_archaic = ["ᄀᄁᄂᄃᇹᇫ"]
         target_archaic = ["ㄱㄲㄴㄷㆆㅿ"]
@@ -263,7 +408,7 @@ class TestJamo(unittest.TestCase):
         target_strings_unmapped = test_strings_unmapped
 
         all_tests = itertools.chain(
-            zip(test_chars, target_chars, strict=True),
+            zip(test_modern, target_modern, strict=True),
             zip(test_archaic, target_archaic, strict=True),
             zip(test_strings_idempotent, target_strings_idempotent, strict=True),
             zip(test_strings_unmapped, target_strings_unmapped, strict=True),
@@ -275,11 +420,8 @@ class TestJamo(unittest.TestCase):
             assert isinstance(trial, types.GeneratorType), (
                 "jamo_to_hcj didn't return an instance of a generator."
             )
-            trial, target = "".join(trial), "".join(target)
-            test_str = "".join(test)
-            assert trial == target, (
-                f"Matched {test_str} to {trial}, but expected {target}."
-            )
+            trial = "".join(trial)
+            assert trial == target, f"Matched {test} to {trial}, but expected {target}."
 
         # Test j2hcj (string version)
         test_strings = ["", "test123", "ᄀᄁᄂᄃᇹᇫ"]
@@ -287,9 +429,7 @@ class TestJamo(unittest.TestCase):
 
         for test, target in zip(test_strings, target_strings, strict=True):
             trial = jamo.j2hcj(test)
-            assert trial == target, (
-                "Matched {test} to {trial}, but expected {target}."
-            ).format(test="".join(test), trial=trial, target=target)
+            assert trial == target, f"Matched {test} to {trial}, but expected {target}."
 
     def test_hcj_to_jamo(self):
         """hcj_to_jamo and hcj2j tests (hcj2j is an alias for hcj_to_jamo).
@@ -297,33 +437,19 @@ class TestJamo(unittest.TestCase):
         Arguments may be single characters along with the desired jamo class
         (lead, vowel, tail).
         """
-        test_args = [
-            ("ㄱ", "lead"),
-            ("ㄱ", "tail"),
-            ("ㅎ", "lead"),
-            ("ㅎ", "tail"),
-            ("ㅹ", "lead"),
-            ("ㅥ", "tail"),
-            ("ㅏ", "vowel"),
-            ("ㅣ", "vowel"),
-        ]
-        targets = [
-            chr(0x1100),
-            chr(0x11A8),
-            chr(0x1112),
-            chr(0x11C2),
-            chr(0x112C),
-            chr(0x11FF),
-            chr(0x1161),
-            chr(0x1175),
-        ]
+        # Every modern HCJ in each of its classes, and some archaic ones
+        expected = {
+            **_HCJ_TO_JAMO_MODERN,
+            ("lead", "ㅹ"): chr(0x112C),
+            ("tail", "ㅥ"): chr(0x11FF),
+        }
 
         # Test both hcj_to_jamo and its alias hcj2j
         for func in (jamo.hcj_to_jamo, jamo.hcj2j):
-            for (jamo_class, jamo_char), target in zip(test_args, targets, strict=True):
-                trial = func(jamo_class, jamo_char)
+            for (jamo_class, hcj_char), target in expected.items():
+                trial = func(hcj_char, jamo_class)
                 assert trial == target, (
-                    f"{func.__name__}: Converted {ord(jamo_char):X} as {jamo_class} to "
+                    f"{func.__name__}: Converted {ord(hcj_char):X} as {jamo_class} to "
                     f"{ord(trial):X}, but expected {ord(target):X}."
                 )
 
@@ -380,26 +506,12 @@ class TestJamo(unittest.TestCase):
             (chr(0x110C), chr(0x1161), chr(0x1106), chr(0x1169), "=", "字", "母"),
         ]
 
-        for hangul, target in zip(test_cases, desired_jamo, strict=True):
-            trial = jamo.hangul_to_jamo(hangul)
-            assert isinstance(trial, types.GeneratorType), (
-                "hangul_to_jamo didn't return an instance of a generator."
-            )
-            trial = tuple(trial)
-            if len(hangul) == 1:
-                lead = hex(ord(target[0]))
-                vowel = hex(ord(target[1]))
-                tail = hex(ord(target[2])) if len(target) == 3 else ""
-                failure = tuple(hex(ord(_)) for _ in trial)
-                error_msg = (
-                    f"Converted {hangul} to {failure}, but expected "
-                    f"({lead}, {vowel}, {tail})."
-                )
-            else:
-                error_msg = (
-                    f"Incorrectly converted {hangul} to {[hex(ord(_)) for _ in trial]}."
-                )
-            assert target == trial, error_msg
+        trials = [jamo.hangul_to_jamo(hangul) for hangul in test_cases]
+        assert all(isinstance(trial, types.GeneratorType) for trial in trials), (
+            "hangul_to_jamo didn't return an instance of a generator."
+        )
+        # pytest shows the differing items if this fails.
+        assert [tuple(trial) for trial in trials] == desired_jamo
 
     def test_h2j(self):
         """h2j tests
@@ -413,16 +525,10 @@ class TestJamo(unittest.TestCase):
         tests_idempotent = ["", "test123~", "ㄱㄲㄴㄷㆆㅿ"]
         targets_idempotent = tests_idempotent
 
-        all_tests = itertools.chain(
-            zip(tests, targets, strict=True),
-            zip(tests_idempotent, targets_idempotent, strict=True),
-        )
+        all_tests = [*tests, *tests_idempotent]
+        all_targets = [*targets, *targets_idempotent]
 
-        for test, target in all_tests:
-            trial = jamo.h2j(test)
-            assert trial == target, (
-                f"Converted {test} to {trial}, but expected {target}."
-            )
+        assert [jamo.h2j(test) for test in all_tests] == all_targets
 
     def test_jamo_to_hangul(self):
         """jamo_to_hangul tests
@@ -465,20 +571,15 @@ class TestJamo(unittest.TestCase):
 
         invalid_cases = [("a", "b", "c"), ("a", "b"), ("ㄴ", "ㄴ", "ㄴ"), ("ㅏ", "ㄴ")]
 
-        all_tests = itertools.chain(
-            zip(chr_cases, desired_hangul1, strict=True),
-            zip(hcj_cases, desired_hangul1, strict=True),
-            zip(arity2_cases, desired_hangul2, strict=True),
-            zip(mixed_cases, desired_hangul3, strict=True),
-        )
+        all_tests = [*chr_cases, *hcj_cases, *arity2_cases, *mixed_cases]
+        all_targets = [
+            *desired_hangul1,
+            *desired_hangul1,
+            *desired_hangul2,
+            *desired_hangul3,
+        ]
 
-        for args, hangul in all_tests:
-            trial = jamo.jamo_to_hangul(*args)
-            assert hangul == trial, (
-                "Conversion from hcj to Hangul failed. "
-                "Incorrect conversion from"
-                f"({args}) to ({hangul}). Got {trial}."
-            )
+        assert [jamo.jamo_to_hangul(*args) for args in all_tests] == all_targets
 
         # Negative tests
         for _ in invalid_cases:
@@ -512,12 +613,13 @@ class TestJamo(unittest.TestCase):
         Should output a tuple of non-compound jamo for every compound
         jamo.
         """
-        invalid_hangul = _get_random_hangul(20)
+        invalid_hangul = _RANDOM_HANGUL
         invalid_other = _INVALID_CHARS_BASE
 
         # TODO: Expand tests to be more comprehensive, maybe use unicode names.
         test_chars = ["ㄸ", "ㅢ"]
-        target_chars = [("ㄷ", "ㄷ"), ("ㅡ", "ㅣ")]
+        # Targets are strings so that only the trial needs to be joined
+        target_chars = ["ㄷㄷ", "ㅡㅣ"]
 
         test_chars_idempotent = list(itertools.chain(invalid_hangul, invalid_other))
         target_chars_idempotent = test_chars_idempotent
@@ -544,11 +646,8 @@ class TestJamo(unittest.TestCase):
                     assert jamo.is_jamo(trial_char), (
                         "decompose_jamo returned non-jamo character"
                     )
-            trial, target = "".join(trial), "".join(target)
-            test_str = "".join(test)
-            assert trial == target, (
-                f"Matched {test_str} to {trial}, but expected {target}."
-            )
+            trial = "".join(trial)
+            assert trial == target, f"Matched {test} to {trial}, but expected {target}."
 
         # Negative tests
         for test_string in invalid_strings:
@@ -598,34 +697,15 @@ class TestJamo(unittest.TestCase):
         for others, raising a TypeError if receiving more than one
         character as input.
         """
-        valid_compounds = (
-            "ᄁᄄᄈᄊᄍᄓᄔᄕᄖᄗᄘᄙᄚᄛᄜᄝᄞᄟᄠᄡᄢᄣᄤᄥᄦᄧᄨᄩᄪᄫᄬᄭᄮᄯᄰᄱᄲᄳᄴᄵᄶᄷᄸᄹᄺᄻᄽᄿ"
-            "ᅁᅂᅃᅄᅅᅆᅇᅈᅉᅊᅋᅍᅏᅑᅒᅓᅖᅗᅘᅚᅛᅜᅝᅞᅪᅫᅬᅯᅰᅱᅴᅶᅷᅸᅹᅺᅻᅼᅽᅾᅿᆀᆁᆂᆃᆄᆅᆆ"
-            "ᆇᆈᆉᆊᆋᆌᆍᆎᆏᆐᆑᆒᆓᆔᆕᆖᆗᆘᆙᆚᆛᆜᆝᆟᆠᆡᆢᆣᆤᆥᆦᆧᆩᆪᆬᆭᆰᆱᆲᆳᆴᆵᆶᆹᆻᇃᇄᇅ"
-            "ᇆᇇᇈᇉᇊᇋᇌᇍᇎᇏᇐᇑᇒᇓᇔᇕᇖᇗᇘᇙᇚᇛᇜᇝᇞᇟᇠᇡᇢᇣᇤᇥᇦᇧᇨᇩᇪᇬᇭᇮᇯᇱᇲᇳᇴᇵᇶᇷ"
-            "ᇸᇺᇻᇼᇽᇾᇿㄲㄳㄵㄶㄸㄺㄻㄼㄽㄾㄿㅀㅃㅄㅆㅉㅘㅙㅚㅝㅞㅟㅢㅥㅦㅧㅨㅩㅪㅫㅬㅭㅮㅯㅰㅱㅲㅳㅴㅵㅶ"
-            "ㅷㅸㅹㅺㅻㅼㅽㅾㆀㆂㆃㆄㆅㆇㆈㆉㆊㆋㆌㆎꥠꥡꥢꥣꥤꥥꥦꥧꥨꥩꥪꥫꥬꥭꥮꥯꥰꥱꥲꥳꥴꥵꥶꥷꥸꥹꥺ"
-            "ꥻꥼힰힱힲힳힴힵힶힷힸힹힺힻힼힽힾힿퟀퟁퟂퟃퟄퟅퟆퟋퟌퟍퟎퟏퟐퟑퟒퟓퟔퟕퟖퟗퟘퟙퟚퟛퟜퟝퟞퟟퟠퟡ"
-            "ퟢퟣퟤퟥퟦퟧퟨퟩퟪퟫퟬퟭퟮퟯퟰퟱퟲퟳퟴퟵퟶퟷퟸퟹퟺퟻᅢᅤᅦᅨㅐㅒㅔㅖ"
-        )
-
-        non_compound_jamo = (
-            "ᄀᄂᄃᄅᄆᄇᄉᄋᄌᄎᄏᄐᄑᄒᄼᄾᅀᅌᅎᅐᅔᅕᅟᅠᅡᅣᅥᅧᅩᅭᅮᅲᅳᅵᆞᆨᆫᆮᆯᆷᆸᆺᆼᆽᆾᆿ"
-            "ᇀᇁᇂᇫᇰㄱㄴㄷㄹㅁ ㅂㅅㅇㅈㅊㅋㅌㅍㅎㅏㅑㅓㅕㅗㅛㅜㅠㅡㅣㅿㆁㆍ"
-        )
-        invalid_hangul = _get_random_hangul(20)
-        invalid_other = _INVALID_CHARS_BASE
-
         # Positive tests
-        for valid_compound in itertools.chain(valid_compounds):
+        for valid_compound in _VALID_COMPOUNDS:
             assert jamo.is_jamo_compound(valid_compound), (
                 f"Incorrectly decided U+{ord(valid_compound):X} was not a "
                 "jamo compound."
             )
-        # Negative tests
-        for invalid_case in itertools.chain(
-            non_compound_jamo, invalid_hangul, invalid_other
-        ):
+        # Negative tests, see test_rejects_hangul/test_rejects_non_jamo for common
+        # invalid input
+        for invalid_case in _NON_COMPOUND_JAMO:
             assert not jamo.is_jamo_compound(invalid_case), (
                 f"Incorrectly decided U+{ord(invalid_case):X} was jamo."
             )